@@ -12,6 +12,7 @@ SOURCE = os.path.join(ROOT, 'src')
 def make_groups():
     groups = {}
     for directory, subdirs, files in os.walk(SOURCE):
+        subdirs[:] = [d for d in subdirs if not d.startswith('.')]
         if files:
             group_name = os.path.basename(directory).title()
             name_list = []
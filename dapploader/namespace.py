@@ -1,16 +1,71 @@
+from binascii import unhexlify
 from collections import OrderedDict
 from os.path import basename
-import rlp
 import sha3
 
+
+class NamespaceError(Exception): pass
+
+
+def encode_address(address):
+    """RLP encodes a raw 20 byte address."""
+    if len(address) != 20:
+        raise NamespaceError(
+            'address must be 20 bytes, got {}'.format(len(address)))
+    # RLP string header for a 20 byte string is 0x80 + 20.
+    return bytearray(b'\x94') + bytearray(address)
+
+
+def encode_nonce(nonce):
+    """RLP encodes a nonce, which must fit in 64 bits."""
+    if not 0 <= nonce < 2 ** 64:
+        raise NamespaceError('nonce out of range: {}'.format(nonce))
+    if nonce == 0:
+        return bytearray(b'\x80')
+    if nonce < 0x80:
+        return bytearray([nonce])
+    result = bytearray()
+    while nonce:
+        result.insert(0, nonce & 0xff)
+        nonce >>= 8
+    result.insert(0, 0x80 + len(result))
+    return result
+
+
+def encode_seed(encoded_address, nonce):
+    """RLP encodes [address, nonce], given the output of encode_address."""
+    body = encoded_address + encode_nonce(nonce)
+    # encode_address gives 21 bytes and encode_nonce at most 9, so the
+    # short list header always fits.
+    return bytes(bytearray([0xc0 + len(body)]) + body)
+
+
 class Namespace(OrderedDict):
-    """A namespace for a dapp."""
+    """A namespace for a dapp.
+
+    Arguments:
+    creator -- The address that creates the contracts, as a 0x-prefixed
+               hex string of 20 bytes.
+    """
     def __init__(self, creator):
+        try:
+            prefixed = creator.startswith('0x')
+        except (AttributeError, TypeError):
+            prefixed = False
+        if not prefixed:
+            raise NamespaceError(
+                'creator must be a 0x-prefixed hex string: {!r}'.format(creator))
         self.creator = creator
+        try:
+            self.raw_creator = unhexlify(creator[2:])
+        except (TypeError, ValueError):
+            raise NamespaceError(
+                'creator is not valid hex: {!r}'.format(creator))
+        self.encoded_creator = encode_address(self.raw_creator)
 
     def add_source(self, path):
         """Add a source file to the namespace."""
         code_name = basename(path).rstrip('.se')
-        address_seed = rlp.encode([self.creator, len(self)])
-        address = '0x' + sha3.sha3_256(address_seed).hexdigest()[24:]
+        address_seed = encode_seed(self.encoded_creator, len(self))
+        address = '0x' + sha3.keccak_256(address_seed).hexdigest()[24:]
         self[code_name] = {'path': path, 'address': address}
@@ -1,14 +1,74 @@
 """This module defines functions which preprocess Serpent code.
 It transforms import statments into the appropriate native Serpent mechanism.
 """
+import errno
+import os
+import re
 import serpent
 # TODO: add registry to live network and put address here
 REG_ADDR = "0x0"
+# Matches every line starting with import; 'module' and 'name' are only
+# set when the line is a well formed `import X as Y`.
+IMPORT_PATTERN = re.compile(br'^[ \t]*import\b'
+                            br'(?:[ \t]+(?P<module>\w+)[ \t]+as[ \t]+(?P<name>\w+)'
+                            br'[ \t]*(?:#[^\r\n]*)?\r?$)?'
+                            br'[^\n]*\n?',
+                            re.MULTILINE)
 
 
 class PreprocessorError(Exception): pass
 
 
+def read_source(path):
+    """Reads a whole source file without going through the io layer.
+
+    Reads until EOF, since os.read may return fewer bytes than asked for.
+    """
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        chunks = []
+        size = max(os.fstat(fd).st_size, 1 << 12)
+        while True:
+            try:
+                chunk = os.read(fd, size)
+            except OSError as error:
+                # Python 2 does not retry reads interrupted by a signal.
+                if error.errno == errno.EINTR:
+                    continue
+                raise
+            if not chunk:
+                return b''.join(chunks)
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+
+
+def strip_imports(path, code, namespace):
+    """Removes the import statements from code.
+
+    Returns the stripped code and a list of (alias, address) pairs.
+    """
+    dependencies = []
+
+    def strip_import(match):
+        if match.group('module') is None:
+            line_number = code.count(b'\n', 0, match.start()) + 1
+            line = match.group().strip().decode('utf-8', 'replace')
+            raise PreprocessorError('{}:{}: malformed import: {}'.format(
+                path, line_number, line))
+        dep_name = match.group('module').decode()
+        code_alias = match.group('name').decode()
+        try:
+            dependency_address = namespace[dep_name]['address']
+        except KeyError:
+            raise PreprocessorError(
+                '{} imports unknown contract {}'.format(path, dep_name))
+        dependencies.append((code_alias, dependency_address))
+        return b''
+
+    return IMPORT_PATTERN.sub(strip_import, code), dependencies
+
+
 class Preprocessor(object):
     """Processes imports statements into Serpent code."""
 
@@ -18,22 +78,9 @@ class Preprocessor(object):
     def parse_dependencies(self):
         """Separates code and import statements."""
         for name in self.namespace:
-            contract_info = self.namespace[name]
-            path = contract_info['path']
-            source = open(path)
-            stripped_code = []
-            dependencies = []
-            for line in source:
-                if line.startswith('import'):
-                    parts = line.split(' ')
-                    dep_name = parts[1]
-                    code_alias = parts[3]
-                    dependency_address = self[dep_name]['address']
-                    dependencies.append((code_alias, dependency_address))
-                else:
-                    stripped_code.append(line)
-            stripped_code = '\n'.join(stripped_code)
-            self.namespace[]
+            path = self.namespace[name]['path']
+            stripped_code, dependencies = strip_imports(
+                path, read_source(path), self.namespace)
             yield stripped_code, dependencies, serpent.mk_signature(stripped_code)
 
 
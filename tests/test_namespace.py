@@ -0,0 +1,67 @@
+"""Regression checks for the specialized RLP encoder in dapploader.namespace."""
+import unittest
+from binascii import unhexlify
+
+from dapploader.namespace import (Namespace, NamespaceError, encode_address,
+                                  encode_seed)
+
+CREATOR = unhexlify('6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0')
+
+# rlp.encode([CREATOR, nonce]) as produced by pyrlp.
+VECTORS = [
+    (0, 'd6946ac7ea33f8831ea9dcc53393aaa88b25a785dbf080'),
+    (1, 'd6946ac7ea33f8831ea9dcc53393aaa88b25a785dbf001'),
+    (0x7f, 'd6946ac7ea33f8831ea9dcc53393aaa88b25a785dbf07f'),
+    (0x80, 'd7946ac7ea33f8831ea9dcc53393aaa88b25a785dbf08180'),
+    (0x100, 'd8946ac7ea33f8831ea9dcc53393aaa88b25a785dbf0820100'),
+    (70000, 'd9946ac7ea33f8831ea9dcc53393aaa88b25a785dbf083011170'),
+]
+
+
+class EncodeSeedTest(unittest.TestCase):
+
+    def test_matches_pyrlp(self):
+        encoded_creator = encode_address(CREATOR)
+        for nonce, expected in VECTORS:
+            self.assertEqual(encode_seed(encoded_creator, nonce),
+                             unhexlify(expected))
+
+    def test_rejects_wrong_length(self):
+        self.assertRaises(NamespaceError, encode_address, CREATOR[:2])
+
+    def test_rejects_nonce_out_of_range(self):
+        encoded_creator = encode_address(CREATOR)
+        for nonce in (-1, 2 ** 64, 2 ** 300):
+            self.assertRaises(NamespaceError, encode_seed,
+                              encoded_creator, nonce)
+
+
+class NamespaceCreatorTest(unittest.TestCase):
+
+    def test_rejects_odd_length_hex(self):
+        self.assertRaises(NamespaceError, Namespace, '0x' + 'a' * 39)
+
+    def test_rejects_non_hex(self):
+        self.assertRaises(NamespaceError, Namespace, '0x' + 'zz' * 20)
+
+    def test_rejects_missing_prefix(self):
+        self.assertRaises(NamespaceError, Namespace, 'ab' * 20)
+
+    def test_rejects_wrong_length(self):
+        self.assertRaises(NamespaceError, Namespace, '0x1234')
+        self.assertRaises(NamespaceError, Namespace, '0x' + 'ab' * 21)
+
+
+class AddSourceTest(unittest.TestCase):
+
+    def test_contract_addresses(self):
+        namespace = Namespace('0x6ac7ea33f8831ea9dcc53393aaa88b25a785dbf0')
+        namespace.add_source('src/first.se')
+        namespace.add_source('src/second.se')
+        self.assertEqual([info['address'] for info in namespace.values()],
+                         ['0xcd234a471b72ba2f1ccf0a70fcaba648a5eecd8d',
+                          '0x343c43a37d37dff08ae8c4a11544c718abb4fcf8'])
+
+
+if __name__ == '__main__':
+    unittest.main()
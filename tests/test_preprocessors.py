@@ -0,0 +1,103 @@
+"""Tests for import stripping in dapploader.preprocessors."""
+import os
+import shutil
+import sys
+import tempfile
+import types
+import unittest
+from collections import OrderedDict
+
+try:
+    import serpent
+except ImportError:
+    # Only mk_signature is used, and only by parse_dependencies.
+    serpent = types.ModuleType('serpent')
+    serpent.mk_signature = lambda code: ''
+    sys.modules['serpent'] = serpent
+
+from dapploader.preprocessors import (PreprocessorError, Preprocessor,
+                                      read_source, strip_imports)
+
+NAMESPACE = {'foo': {'path': 'foo.se', 'address': '0xf00'},
+             'bar': {'path': 'bar.se', 'address': '0xba7'}}
+
+
+class StripImportsTest(unittest.TestCase):
+
+    def test_strips_imports_and_collects_addresses(self):
+        code = (b'import foo as f\n'
+                b'  import bar as b  # the bar contract\n'
+                b'def go():\n'
+                b'    return(f.x() + b.y())\n')
+        stripped, dependencies = strip_imports('a.se', code, NAMESPACE)
+        self.assertEqual(stripped, b'def go():\n    return(f.x() + b.y())\n')
+        self.assertEqual(dependencies, [('f', '0xf00'), ('b', '0xba7')])
+
+    def test_crlf_lines(self):
+        code = b'import foo as f\r\ndef go():\r\n    return(1)\r\n'
+        stripped, dependencies = strip_imports('a.se', code, NAMESPACE)
+        self.assertEqual(stripped, b'def go():\r\n    return(1)\r\n')
+        self.assertEqual(dependencies, [('f', '0xf00')])
+
+    def test_import_without_trailing_newline(self):
+        code = b'def go():\n    return(1)\nimport bar as b'
+        stripped, dependencies = strip_imports('a.se', code, NAMESPACE)
+        self.assertEqual(stripped, b'def go():\n    return(1)\n')
+        self.assertEqual(dependencies, [('b', '0xba7')])
+
+    def test_leaves_other_lines_alone(self):
+        code = b'importer = 1\n# import foo as f\n'
+        self.assertEqual(strip_imports('a.se', code, NAMESPACE), (code, []))
+
+    def test_unknown_import(self):
+        with self.assertRaises(PreprocessorError) as context:
+            strip_imports('a.se', b'import baz as z\n', NAMESPACE)
+        self.assertIn('a.se', str(context.exception))
+        self.assertIn('baz', str(context.exception))
+
+    def test_malformed_import(self):
+        for code in (b'x = 1\nimport   foo\n', b'x = 1\nimport foo as f g\n'):
+            with self.assertRaises(PreprocessorError) as context:
+                strip_imports('a.se', code, NAMESPACE)
+            self.assertIn('a.se:2', str(context.exception))
+
+
+class ReadSourceTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def write(self, name, data):
+        path = os.path.join(self.directory, name)
+        with open(path, 'wb') as f:
+            f.write(data)
+        return path
+
+    def test_reads_bytes_unchanged(self):
+        data = b'import foo as f\r\n' + b'x' * 10000 + b'\r\n'
+        self.assertEqual(read_source(self.write('a.se', data)), data)
+
+    def test_empty_file(self):
+        self.assertEqual(read_source(self.write('a.se', b'')), b'')
+
+    def test_parse_dependencies(self):
+        foo_code = b'def x():\n    return(1)\n'
+        a_code = b'import foo as f\ndef go():\n    return(f.x())\n'
+        namespace = OrderedDict()
+        namespace['foo'] = {'path': self.write('foo.se', foo_code),
+                            'address': '0xf00'}
+        namespace['a'] = {'path': self.write('a.se', a_code),
+                          'address': '0xa'}
+        results = [(code, dependencies) for code, dependencies, _ in
+                   Preprocessor(namespace).parse_dependencies()]
+        self.assertEqual(results,
+                         [(foo_code, []),
+                          (b'def go():\n    return(f.x())\n',
+                           [('f', '0xf00')])])
+
+
+if __name__ == '__main__':
+    unittest.main()